@@ -42,6 +42,7 @@ where:
 __all__ = ["WindsonicAnemometer", "DELIMITER"]
 
 import asyncio
+import concurrent.futures
 import logging
 import time
 from typing import Any, Dict
@@ -74,20 +75,23 @@ class WindsonicAnemometer(SerialReader):
     IndexError if attempted multiple use of serial device instance.
     """
 
+    _instances: Dict[str, "WindsonicAnemometer"] = {}
+    _devices: Dict[str, "WindsonicAnemometer"] = {}
+
     def __init__(self, name: str, uart_device, log=None):
         super().__init__(name, uart_device, log)
         if log is None:
             self.log = logging.getLogger(type(self).__name__)
         else:
             self.log = log.getChild(type(self).__name__)
-        self._instances: Dict[str, "WindsonicAnemometer"] = {}
-        self._devices: Dict[str, "WindsonicAnemometer"] = {}
 
-        if name not in self._instances:
-            if uart_device not in self._devices:
+        if name not in WindsonicAnemometer._instances:
+            if uart_device not in WindsonicAnemometer._devices:
                 self.name: str = name
                 self.comport = uart_device
-                self.output = []
+                self._loop = None
+                self._executor = None
+                self.output = [0.0] * 4
 
                 self.direction: float = DEFAULT_DIRECTION_VAL
                 self.speed: float = DEFAULT_SPEED_VAL
@@ -96,16 +100,20 @@ class WindsonicAnemometer(SerialReader):
                 self._tmp_speed: float = []
 
                 self._read_line_size: int = 0
-                self._instances[name] = self
-                self._devices[uart_device] = self
+                WindsonicAnemometer._instances[name] = self
+                WindsonicAnemometer._devices[uart_device] = self
                 self.log.debug(
-                    f"WindsonicAnemometer:{name}: First instantiation "
-                    f"using serial device {uart_device.name!r}."
+                    "WindsonicAnemometer:%s: First instantiation "
+                    "using serial device %r.",
+                    name,
+                    uart_device.name,
                 )
             else:
                 self.log.debug(
-                    f"WindsonicAnemometer:{name}: Error: "
-                    f"Attempted multiple use of serial device instance {uart_device!r}."
+                    "WindsonicAnemometer:%s: Error: "
+                    "Attempted multiple use of serial device instance %r.",
+                    name,
+                    uart_device,
                 )
                 raise IndexError(
                     f"WindsonicAnemometer:{name}: "
@@ -113,8 +121,8 @@ class WindsonicAnemometer(SerialReader):
                 )
         else:
             self.log.debug(
-                "WindsonicAnemometer: Error: "
-                f"Attempted multiple instantiation of {name!r}."
+                "WindsonicAnemometer: Error: Attempted multiple instantiation of %r.",
+                name,
             )
             raise IndexError(
                 "WindsonicAnemometer: Error: "
@@ -122,20 +130,46 @@ class WindsonicAnemometer(SerialReader):
             )
 
     async def start(self):
-        """Open the communication port and set connection parameters."""
+        """Open the communication port and set connection parameters.
+
+        Starting again while started does nothing, so only one executor
+        thread reads the comport.
+        """
+        if self._executor is not None:
+            return
         await self.comport.open()
+        self._loop = asyncio.get_running_loop()
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f"anemometer-{self.name}"
+        )
         self.comport.baudrate = BAUDRATE
         self.comport.line_size = self._read_line_size
         self.comport.terminator = TERMINATOR
         self.comport.read_timeout = TIMEOUT
     async def stop(self):
-        """Close the comport."""
-
-        await self.comport.close()
+        """Close the comport and release the instance name and device.
 
-    async def _message(self, text: Any) -> None:
-        # Print a message prefaced with the SEL_TEMPERATURE object info.
-        self.log.debug(f"WindsonicAnemometer:{self.name}: {text}")
+        The instance name and device are released even if closing the
+        comport fails.
+        """
+        try:
+            if self._executor is not None:
+                # Wait for any readline in progress before closing the comport.
+                await self._loop.run_in_executor(None, self._executor.shutdown)
+                self._executor = None
+            await self.comport.close()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+            if WindsonicAnemometer._instances.get(self.name) is self:
+                del WindsonicAnemometer._instances[self.name]
+            if WindsonicAnemometer._devices.get(self.comport) is self:
+                del WindsonicAnemometer._devices[self.comport]
+
+    def _message(self, text: Any) -> None:
+        # Print a message prefaced with the WindsonicAnemometer object info.
+        self.log.debug("WindsonicAnemometer:%s: %s", self.name, text)
 
     async def read(self) -> []:
         """Read anemometer instrument.
@@ -151,13 +185,12 @@ class WindsonicAnemometer(SerialReader):
         err: str = ""
         ser_line: str = ""
         line: str = ""
-        await self._message("Reading line from comport.")
-
-        # Set up loop variable for async calls
-        loop = asyncio.get_event_loop()
+        self._message("Reading line from comport.")
 
-        err, ser_line = await loop.run_in_executor(None, self.comport.readline)
-        await self._message("Done.")
+        err, ser_line = await self._loop.run_in_executor(
+            self._executor, self.comport.readline
+        )
+        self._message("Done.")
         if err == "OK":
             resp = ser_line.strip(TERMINATOR)
             data = resp.split(DELIMITER)
@@ -182,8 +215,7 @@ class WindsonicAnemometer(SerialReader):
         else:
             err == "Timeout."
 
-        self.output = []
-        self.output.append(time.time())
-        self.output.append(err)
-        self.output.append(self.direction)
-        self.output.append(self.speed)
+        self.output[0] = time.time()
+        self.output[1] = err
+        self.output[2] = self.direction
+        self.output[3] = self.speed
@@ -124,9 +124,14 @@ class EssCsc(salobj.ConfigurableCsc):
         sel_temperature = SelTemperature(
             self.config.name, self.device, self.config.channels, self.log
         )
-        self.ess_instrument = EssInstrument(
-            self.config.name, sel_temperature, self.get_telemetry, self.log
-        )
+        try:
+            self.ess_instrument = EssInstrument(
+                self.config.name, sel_temperature, self.get_telemetry, self.log
+            )
+        except Exception:
+            # Release the reader's instance name and device.
+            await sel_temperature.stop()
+            raise
         self.log.info("Connection to the sensor established.")
 
     async def begin_enable(self, id_data):
@@ -173,21 +178,29 @@ class EssCsc(salobj.ConfigurableCsc):
             Command ID and data
         """
         self.cmd_disable.ack_in_progress(id_data, timeout=60)
-        try:
-            await self.ess_instrument.stop()
-        except Exception:
-            self.log.exception("Error in begin_disable. Continuing...")
-
         await self.disconnect()
         await super().begin_disable(id_data)
 
     async def disconnect(self):
         """Disconnect from the ESS sensor, if connected, and stop the mock
         sensor, if running.
+
+        Stopping the ESS Instrument releases its instance name and device, so
+        that the CSC can connect again.
         """
         self.log.info("Disconnecting")
+        if self.ess_instrument is not None:
+            try:
+                await self.ess_instrument.stop()
+            except Exception:
+                self.log.exception("Error stopping the ESS Instrument. Continuing...")
         self.ess_instrument = None
 
+    async def close_tasks(self):
+        """Disconnect from the ESS sensor before closing the CSC."""
+        await self.disconnect()
+        await super().close_tasks()
+
     async def configure(self, config):
         self.config = config
 
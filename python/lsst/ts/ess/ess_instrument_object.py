@@ -43,37 +43,43 @@ class EssInstrument:
     IndexError if attempted multiple use of serial device instance.
     """
 
+    _instances: Dict[str, "EssInstrument"] = {}
+    _devices: Dict[str, "EssInstrument"] = {}
+
     def __init__(self, name: str, reader, callback_func, log=None):
-        self._instances: Dict[str, "EssInstrument"] = {}
-        self._devices: Dict[str, "EssInstrument"] = {}
         if log is None:
             self.log = logging.getLogger(type(self).__name__)
         else:
             self.log = log.getChild(type(self).__name__)
-        if name not in self._instances:
-            if reader.comport not in self._devices:
+        if name not in EssInstrument._instances:
+            if reader.comport not in EssInstrument._devices:
                 try:
                     self._reader = reader
                 except AttributeError:
                     self.log.debug(
-                        f"EssInstrument:{name}: Failed to instantiate "
-                        f"using reader object {reader.name!r}."
+                        "EssInstrument:%s: Failed to instantiate "
+                        "using reader object %r.",
+                        name,
+                        reader.name,
                     )
                 self._enabled: bool = False
                 self.name: str = name
                 self._callback_func = callback_func
                 self.telemetry_loop = None
 
-                self._instances[name] = self
-                self._devices[reader.comport] = self
+                EssInstrument._instances[name] = self
+                EssInstrument._devices[reader.comport] = self
                 self.log.debug(
-                    f"EssInstrument:{name}: First instantiation "
-                    f"using reader object {reader.name!r}."
+                    "EssInstrument:%s: First instantiation using reader object %r.",
+                    name,
+                    reader.name,
                 )
             else:
                 self.log.debug(
-                    f"EssInstrument:{name}: Error: "
-                    f"Attempted multiple use of reader serial device instance {reader.comport}."
+                    "EssInstrument:%s: Error: "
+                    "Attempted multiple use of reader serial device instance %s.",
+                    name,
+                    reader.comport,
                 )
                 raise IndexError(
                     f"EssInstrument:{name}: "
@@ -81,32 +87,49 @@ class EssInstrument:
                 )
         else:
             self.log.debug(
-                "EssInstrument: Error: "
-                f"Attempted multiple instantiation of {name!r}."
+                "EssInstrument: Error: Attempted multiple instantiation of %r.", name
             )
             raise IndexError(
                 "EssInstrument: Error: "
                 f"Attempted multiple instantiation of {name!r}."
             )
 
-    async def _message(self, text: Any) -> None:
+    def _message(self, text: Any) -> None:
         # Print a message prefaced with the InstrumentThread object info.
-        self.log.debug(f"EssInstrument:{self.name}: {text}")
+        self.log.debug("EssInstrument:%s: %s", self.name, text)
 
     async def start(self):
         """Start the instrument read loop."""
-        msg = f"Starting read loop for {self._reader.name!r} instrument."
-        await self._message(msg)
+        self.log.debug(
+            "EssInstrument:%s: Starting read loop for %r instrument.",
+            self.name,
+            self._reader.name,
+        )
         self._enabled = True
         self.telemetry_loop = asyncio.ensure_future(self._run())
 
     async def stop(self):
-        """Terminate the instrument read loop."""
-        msg = f"Stopping read loop for {self._reader.name!r} instrument."
-        await self._message(msg)
-        self.telemetry_loop.cancel()
-        await self._reader.stop()
-        self._enabled = False
+        """Terminate the instrument read loop and release the instance name
+        and device.
+
+        The instance name and device are released even if stopping the
+        reader fails.
+        """
+        self.log.debug(
+            "EssInstrument:%s: Stopping read loop for %r instrument.",
+            self.name,
+            self._reader.name,
+        )
+        if self.telemetry_loop is not None:
+            self.telemetry_loop.cancel()
+        try:
+            await self._reader.stop()
+        finally:
+            self._enabled = False
+            if EssInstrument._instances.get(self.name) is self:
+                del EssInstrument._instances[self.name]
+            if EssInstrument._devices.get(self._reader.comport) is self:
+                del EssInstrument._devices[self._reader.comport]
 
     async def _run(self):
         """Run threaded instrument read loop.
@@ -115,10 +138,10 @@ class EssInstrument:
         callback_func function.
         """
         msg = "Starting reader."
-        await self._message(msg)
+        self._message(msg)
         await self._reader.start()
         while self._enabled:
             msg = "Reading data."
-            await self._message(msg)
+            self._message(msg)
             await self._reader.read()
             await self._callback_func(self._reader.output)
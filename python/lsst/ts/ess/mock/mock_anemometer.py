@@ -82,6 +82,5 @@ class MockAnemometer:
     def readline(self):
         self.log.info("read")
         err: str = "OK"
-        resp = ""
-        resp += self.format_anemometer()
+        resp = self.format_anemometer()
         return err, resp
@@ -20,8 +20,6 @@ __all__ = ["MockTemperatureSensor", "MIN_TEMP", "MAX_TEMP"]
 
 import asyncio
 import logging
-import random
-import time
 
 import numpy as np
 
@@ -43,6 +41,7 @@ class MockTemperatureSensor:
         self.channels = channels
         self.count_offset = count_offset
         self.nan_channel = nan_channel
+        self._preambles = [f"C{i + count_offset:02d}=" for i in range(channels)]
 
         # Device parameters
         self.line_size = None
@@ -63,22 +62,21 @@ class MockTemperatureSensor:
     async def close(self) -> None:
         pass
 
-    def format_temperature(self, i):
-        temp = random.uniform(MIN_TEMP, MAX_TEMP)
-        s = f"C{i + self.count_offset:02d}={temp:09.4f}"
-        if i == self.nan_channel:
-            s = f"C{i + self.count_offset:02d}=9999.9990"
-        if i == self.channels - 1:
-            s += self.terminator
-        else:
-            s += DELIMITER
-        return s
+    def format_temperature(self, i, temp):
+        return self._preambles[i] + "%09.4f" % temp
 
-    def readline(self):
+    async def readline(self):
         self.log.info("read")
         err: str = "OK"
-        resp = ""
-        for i in range(0, self.channels):
-            time.sleep(CH_ACQ_TIME)
-            resp += self.format_temperature(i)
+        temps = np.random.uniform(MIN_TEMP, MAX_TEMP, self.channels)
+        # Out of range NaN channels are ignored.
+        if self.nan_channel is not None and 0 <= self.nan_channel < self.channels:
+            temps[self.nan_channel] = 9999.999
+        await asyncio.sleep(CH_ACQ_TIME * self.channels)
+        resp = (
+            DELIMITER.join(
+                self.format_temperature(i, temp) for i, temp in enumerate(temps)
+            )
+            + self.terminator
+        )
         return err, resp
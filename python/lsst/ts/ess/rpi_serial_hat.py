@@ -247,7 +247,7 @@ class RpiSerialHat:
 
     def _message(self, text: Any) -> None:
         # Print a message prefaced with the object info ('Any').
-        self.log.debug("RpiSerialHat:{}: {}".format(self.name, text))
+        self.log.debug("RpiSerialHat:%s: %s", self.name, text)
 
     def _rpi_pin_cleanup(self, rpi_pin) -> None:
         # Clear RPi pin.
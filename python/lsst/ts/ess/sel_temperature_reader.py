@@ -49,7 +49,10 @@ where:
 __all__ = ["SelTemperature", "DELIMITER"]
 
 import asyncio
+import concurrent.futures
+import inspect
 import logging
+import re
 import time
 from typing import Any, Dict
 
@@ -94,6 +97,10 @@ SENSOR_UNCONNECTED_VAL: str = "-201.0000"
 """Channel value output by SEL instrument for unconnected temperature sensor.
 """
 
+_CHANNEL_PATTERN: str = r"C(\d{2})=([-\d]\d{3}\.\d{4})"
+"""Serial data channel pattern, capturing channel number and value.
+"""
+
 
 class SelTemperature(SerialReader):
     """SEL temperature instrument protocol converter object.
@@ -113,32 +120,37 @@ class SelTemperature(SerialReader):
     IndexError if attempted multiple use of serial device instance.
     """
 
+    _instances: Dict[str, "SelTemperature"] = {}
+    _devices: Dict[str, "SelTemperature"] = {}
+
     def __init__(self, name: str, uart_device, channels: int, log=None):
         super().__init__(name, uart_device, log)
         if log is None:
             self.log = logging.getLogger(type(self).__name__)
         else:
             self.log = log.getChild(type(self).__name__)
-        self._instances: Dict[str, "SelTemperature"] = {}
-        self._devices: Dict[str, "SelTemperature"] = {}
 
-        if name not in self._instances:
-            if uart_device not in self._devices:
+        if name not in SelTemperature._instances:
+            if uart_device not in SelTemperature._devices:
                 self.name: str = name
                 self._channels: int = channels
                 self.comport = uart_device
-
-                self.temperature: float = []
-                self.output = []
-
-                self._preamble_str: str = []
-                self._old_preamble_str: str = []
-                self._tmp_temperature: float = []
-                for i in range(self._channels):
-                    self._tmp_temperature.append(DEFAULT_VAL)
-                    self.temperature.append(DEFAULT_VAL)
-                    self._preamble_str.append(f"C{i:02}=")
-                    self._old_preamble_str.append(f"C{i+1:02}=")
+                self._loop = None
+                self._executor = None
+                self._async_readline = False
+                self._reading = False
+                self._read_task = None
+                self._lines = None
+
+                self._defaults = (DEFAULT_VAL,) * self._channels
+                self.temperature: float = list(self._defaults)
+                self.output = [0.0] * (self._channels + 2)
+
+                # Expected channel numbers, keyed by the first channel number.
+                self._channel_numbers = {
+                    "00": tuple(f"{i:02}" for i in range(self._channels)),
+                    "01": tuple(f"{i + 1:02}" for i in range(self._channels)),
+                }
 
                 self._read_line_size: int = (
                     self._channels * (PREAMBLE_SIZE + VALUE_SIZE + len(DELIMITER))
@@ -146,16 +158,25 @@ class SelTemperature(SerialReader):
                     + (len(TERMINATOR))
                 )
 
-                self._instances[name] = self
-                self._devices[uart_device] = self
+                # Pattern for a complete line with this number of channels.
+                self._line_re = re.compile(
+                    re.escape(DELIMITER).join([_CHANNEL_PATTERN] * self._channels)
+                    + re.escape(TERMINATOR)
+                )
+
+                SelTemperature._instances[name] = self
+                SelTemperature._devices[uart_device] = self
                 self.log.debug(
-                    f"SelTemperature:{name}: First instantiation "
-                    f"using serial device {uart_device.name!r}."
+                    "SelTemperature:%s: First instantiation using serial device %r.",
+                    name,
+                    uart_device.name,
                 )
             else:
                 self.log.debug(
-                    f"SelTemperature:{name}: Error: "
-                    f"Attempted multiple use of serial device instance {uart_device!r}."
+                    "SelTemperature:%s: Error: "
+                    "Attempted multiple use of serial device instance %r.",
+                    name,
+                    uart_device,
                 )
                 raise IndexError(
                     f"SelTemperature:{name}: "
@@ -163,8 +184,7 @@ class SelTemperature(SerialReader):
                 )
         else:
             self.log.debug(
-                "SelTemperature: Error: "
-                f"Attempted multiple instantiation of {name!r}."
+                "SelTemperature: Error: Attempted multiple instantiation of %r.", name
             )
             raise IndexError(
                 "SelTemperature: Error: "
@@ -172,48 +192,77 @@ class SelTemperature(SerialReader):
             )
 
     async def start(self):
-        """Open the comport and set the connection parameters."""
+        """Open the comport and set the connection parameters.
+
+        A coroutine comport readline is awaited directly by `read`.
+        A blocking comport readline is run continuously by a single
+        long-running job in a dedicated executor thread, which hands each
+        line to `read` through a queue. Starting again while that job is
+        running does nothing, so only one thread reads the comport.
+        """
+        if self._read_task is not None:
+            return
         await self.comport.open()
+        self._loop = asyncio.get_running_loop()
         self.comport.line_size = self._read_line_size
         self.comport.terminator = TERMINATOR
         self.comport.baudrate = BAUDRATE
         self.comport.read_timeout = ((self._channels + 1) * CH_READ_TIME)
+        self._async_readline = inspect.iscoroutinefunction(self.comport.readline)
+        if not self._async_readline:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix=f"sel-{self.name}"
+            )
+            self._lines = asyncio.Queue(maxsize=1)
+            self._reading = True
+            self._read_task = self._loop.run_in_executor(
+                self._executor, self._read_lines
+            )
 
     async def stop(self):
-        """Close the comport."""
-        await self.comport.close()
+        """Close the comport and release the instance name and device.
 
-    async def _message(self, text: Any) -> None:
-        # Print a message prefaced with the SEL_TEMPERATURE object info.
-        self.log.debug(f"SelTemperature:{self.name}: {text}")
-
-    def _test_val(self, preamble, sensor_str):
-        """Test temperature channel data string.
-
-        Parameters
-        ----------
-        preamble : 'str'
-            Preamble string for channel data (eg."C01=").
-        sensor_str : 'str'
-            Sensor channel data string (eg."C01=0001.4500")
-
-        Returns
-        -------
-        Status : 'bool'
-            Return is True if sensor string is valid, False if not.
+        The instance name and device are released even if closing the
+        comport fails.
         """
-        if sensor_str[0:PREAMBLE_SIZE] == preamble:
+        try:
+            if self._read_task is not None:
+                # The reader job exits after its current readline returns.
+                self._reading = False
+                await self._read_task
+                self._read_task = None
+            await self.comport.close()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+            if SelTemperature._instances.get(self.name) is self:
+                del SelTemperature._instances[self.name]
+            if SelTemperature._devices.get(self.comport) is self:
+                del SelTemperature._devices[self.comport]
+
+    def _message(self, text: Any) -> None:
+        # Print a message prefaced with the SEL_TEMPERATURE object info.
+        self.log.debug("SelTemperature:%s: %s", self.name, text)
+
+    def _read_lines(self) -> None:
+        # Read lines from a blocking comport until stopped. Runs in the
+        # executor thread. An exception stops reading and is passed on to be
+        # raised by read.
+        while self._reading:
             try:
-                float(
-                    sensor_str[
-                        PREAMBLE_SIZE : PREAMBLE_SIZE + VALUE_SIZE + len(DELIMITER) - 1
-                    ]
-                )
-                return True
-            except ValueError as e:
-                self.log.exception(e)
-                return False
-                pass
+                line = self.comport.readline()
+            except Exception as e:
+                self._reading = False
+                line = e
+            self._loop.call_soon_threadsafe(self._put_line, line)
+
+    def _put_line(self, line) -> None:
+        # Queue a line read by _read_lines, replacing any unread line so that
+        # read always returns the most recent one.
+        if self._lines.full():
+            self._lines.get_nowait()
+        self._lines.put_nowait(line)
 
     async def read(self) -> []:
         """Read temperature instrument.
@@ -232,47 +281,48 @@ class SelTemperature(SerialReader):
         The line error flag is updated with True if any error found and False
         if no error.
         """
-        for i in range(self._channels):
-            self._tmp_temperature[i] = DEFAULT_VAL
+        unconnected_val = SENSOR_UNCONNECTED_VAL
         err: str = ""
         ser_line: str = ""
-        line: str = ""
-        await self._message("Reading line from comport.")
+        self._message("Reading line from comport.")
 
-        # Set up loop variable for async calls
-        loop = asyncio.get_event_loop()
-
-        err, ser_line = await loop.run_in_executor(None, self.comport.readline)
-        await self._message("Done.")
+        if self._async_readline:
+            err, ser_line = await self.comport.readline()
+        else:
+            line = await self._lines.get()
+            if isinstance(line, Exception):
+                # Reading has stopped, so raise again on any later read.
+                self._lines.put_nowait(line)
+                raise line
+            err, ser_line = line
+        self._message("Done.")
         if err == "OK":
-            if (
-                ser_line[-len(TERMINATOR) :] == TERMINATOR
-                and len(ser_line) == self._read_line_size
-            ):
-                line = ser_line[: -len(TERMINATOR)]
-                temps = line.split(",", self._channels - 1)
-                for i in range(self._channels):
-                    if self._test_val(
-                        self._preamble_str[i], temps[i]
-                    ) or self._test_val(self._old_preamble_str[i], temps[i]):
-                        if temps[i][PREAMBLE_SIZE:] != SENSOR_UNCONNECTED_VAL:
-                            try:
-                                self._tmp_temperature[i] = float(temps[i][PREAMBLE_SIZE:])
-                            except ValueError:
-                                err = f"Temperature data error. Could not convert value(s) to float: {ser_line}"
-                                await self._message(
-                                    f"Failed to convert temperature channel value to float: {ser_line}"
-                                )
+            if len(ser_line) == self._read_line_size and ser_line.endswith(TERMINATOR):
+                match = self._line_re.fullmatch(ser_line)
+                # Groups alternate between channel number and value.
+                fields = match.groups() if match is not None else ()
+                numbers = fields[0::2]
+                # The first channel number selects the expected numbering.
+                if numbers and numbers == self._channel_numbers.get(numbers[0]):
+                    # The pattern only matches the fixed 'snnn.nnnn' value
+                    # format, so float() cannot fail here.
+                    values = fields[1::2]
+                    if unconnected_val in values:
+                        self.temperature = [
+                            (float(value) if value != unconnected_val else DEFAULT_VAL)
+                            for value in values
+                        ]
                     else:
-                        err = f"Malformed response. Channel preamble or channel data incorrect: {ser_line}"
-                    self.temperature[i] = self._tmp_temperature[i]
+                        self.temperature = list(map(float, values))
+                else:
+                    self.temperature = list(self._defaults)
+                    err = f"Malformed response. Channel preamble or channel data incorrect: {ser_line}"
             else:
+                self.temperature = list(self._defaults)
                 err = (
                     f"Malformed response. Terminator or line size incorrect: {ser_line}"
                 )
 
-        self.output = []
-        self.output.append(time.time())
-        self.output.append(err)
-        for i in range(self._channels):
-            self.output.append(self.temperature[i])
+        self.output[0] = time.time()
+        self.output[1] = err
+        self.output[2:] = self.temperature
@@ -167,7 +167,7 @@ class VcpFtdi:
 
     def _message(self, text: Any) -> None:
         # Print a message prefaced with the VCP_FTDI object info ('Any').
-        self.log.debug(f"VcpFtdi:{self.name}: {text}")
+        self.log.debug("VcpFtdi:%s: %s", self.name, text)
 
     async def open(self) -> None:
         """Open VCP.
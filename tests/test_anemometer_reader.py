@@ -16,6 +16,9 @@
 # MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
 # GNU General Public License for more details.
 
+import asyncio
+import threading
+import time
 import unittest
 
 from lsst.ts.ess.anemometer_reader import WindsonicAnemometer, DELIMITER
@@ -32,11 +35,43 @@ from lsst.ts.ess.mock.mock_anemometer import (
 DEFAULT_DIRECTION_VAL: float = 999
 DEFAULT_SPEED_VAL: float = 9999.9990
 
+
+class BlockingMockAnemometer(MockAnemometer):
+    """Mock anemometer with a slow blocking readline."""
+
+    def __init__(self, name: str, no_wind: bool):
+        super().__init__(name, no_wind)
+        self.in_readline = False
+        self.closed_in_readline = False
+        self.max_concurrent_readlines = 0
+        self._num_concurrent_readlines = 0
+        self._lock = threading.Lock()
+
+    async def close(self):
+        self.closed_in_readline = self.in_readline
+
+    def readline(self):
+        with self._lock:
+            self._num_concurrent_readlines += 1
+            self.max_concurrent_readlines = max(
+                self.max_concurrent_readlines, self._num_concurrent_readlines
+            )
+        self.in_readline = True
+        try:
+            time.sleep(0.1)
+            return super().readline()
+        finally:
+            self.in_readline = False
+            with self._lock:
+                self._num_concurrent_readlines -= 1
+
+
 class AnemometerTestCase(unittest.IsolatedAsyncioTestCase):
     async def test_anemometer_reader(self):
         NO_WIND = False
         device = MockAnemometer("MockAnemometer", NO_WIND)
         anemometer = WindsonicAnemometer("Windsonic 60", device)
+        self.addAsyncCleanup(anemometer.stop)
 
         await anemometer.start()
         await anemometer.read()
@@ -44,12 +79,12 @@ class AnemometerTestCase(unittest.IsolatedAsyncioTestCase):
         self.assertTrue(data[1] == "OK")
         self.assertTrue(MIN_DIRN <= data[2] <= MAX_DIRN)
         self.assertTrue(MIN_SPEED <= data[3] <= MAX_SPEED)
-        await anemometer.stop()
 
     async def test_anemometer_reader_nowind(self):
         NO_WIND = True
         device = MockAnemometer("MockAnemometer", NO_WIND)
         anemometer = WindsonicAnemometer("Windsonic 60", device)
+        self.addAsyncCleanup(anemometer.stop)
 
         await anemometer.start()
         await anemometer.read()
@@ -57,4 +92,33 @@ class AnemometerTestCase(unittest.IsolatedAsyncioTestCase):
         self.assertTrue(data[1] == "OK")
         self.assertTrue(data[2] == DEFAULT_DIRECTION_VAL)
         self.assertTrue(MIN_SPEED <= data[3] < LOW_WIND_SPEED)
+
+    async def test_anemometer_reader_start_twice(self):
+        NO_WIND = False
+        device = BlockingMockAnemometer("MockAnemometer", NO_WIND)
+        anemometer = WindsonicAnemometer("Windsonic 60", device)
+        self.addAsyncCleanup(anemometer.stop)
+
+        await anemometer.start()
+        read_task = asyncio.ensure_future(anemometer.read())
+        await asyncio.sleep(0.05)
+        # Starting again must not add a second thread reading the comport.
+        await anemometer.start()
+        await anemometer.read()
+        await read_task
+        self.assertEqual(1, device.max_concurrent_readlines)
+
+    async def test_anemometer_reader_stop_in_readline(self):
+        NO_WIND = False
+        device = BlockingMockAnemometer("MockAnemometer", NO_WIND)
+        anemometer = WindsonicAnemometer("Windsonic 60", device)
+        self.addAsyncCleanup(anemometer.stop)
+
+        await anemometer.start()
+        read_task = asyncio.ensure_future(anemometer.read())
+        await asyncio.sleep(0.05)
+        self.assertTrue(device.in_readline)
+        read_task.cancel()
+        # Stop waits for the current readline before closing the comport.
         await anemometer.stop()
+        self.assertFalse(device.closed_in_readline)
@@ -59,6 +59,19 @@ class CscTestCase(salobj.BaseCscTestCase, unittest.IsolatedAsyncioTestCase):
         logging.info("test_bin_script")
         await self.check_bin_script(name="ESS", index=None, exe_name="run_ess.py")
 
+    async def test_enable_after_close(self):
+        logging.info("test_enable_after_close")
+        # Closing the CSC while enabled must release the instrument, so
+        # that a new CSC can enable with the same configuration.
+        for i in range(2):
+            async with self.make_csc(
+                initial_state=salobj.State.STANDBY, config_dir=None, simulation_mode=1
+            ):
+                await salobj.set_summary_state(
+                    remote=self.remote, state=salobj.State.ENABLED
+                )
+                self.assertTrue(self.csc.connected)
+
     async def test_receive_telemetry(self):
         logging.info("test_receive_telemetry")
         async with self.make_csc(
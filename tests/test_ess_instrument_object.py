@@ -48,6 +48,7 @@ class EssInstrumentObjectTestCase(unittest.IsolatedAsyncioTestCase):
         self.ess_instrument = EssInstrument(
             "MockSensor", sel_temperature, callback_func=self._callback
         )
+        self.addAsyncCleanup(self.ess_instrument.stop)
         self.ess_instrument._enabled = True
         await self.ess_instrument._run()
 
@@ -61,6 +62,7 @@ class EssInstrumentObjectTestCase(unittest.IsolatedAsyncioTestCase):
         self.ess_instrument = EssInstrument(
             "MockSensor", sel_temperature, callback_func=self._callback
         )
+        self.addAsyncCleanup(self.ess_instrument.stop)
         self.ess_instrument._enabled = True
         await self.ess_instrument._run()
 
@@ -76,5 +78,30 @@ class EssInstrumentObjectTestCase(unittest.IsolatedAsyncioTestCase):
         self.ess_instrument = EssInstrument(
             "MockSensor", sel_temperature, callback_func=self._callback
         )
+        self.addAsyncCleanup(self.ess_instrument.stop)
         self.ess_instrument._enabled = True
         await self.ess_instrument._run()
+
+    async def test_stop_with_close_error(self):
+        self.num_channels = 4
+        device = MockTemperatureSensor("MockSensor", self.num_channels)
+
+        async def failing_close():
+            raise IOError("Failed to close.")
+
+        device.close = failing_close
+        sel_temperature = SelTemperature("MockSensor", device, self.num_channels)
+        await sel_temperature.start()
+        self.ess_instrument = EssInstrument(
+            "MockSensor", sel_temperature, callback_func=self._callback
+        )
+        with self.assertRaises(IOError):
+            await self.ess_instrument.stop()
+
+        # The instance names and device are released despite the error.
+        device = MockTemperatureSensor("MockSensor", self.num_channels)
+        sel_temperature = SelTemperature("MockSensor", device, self.num_channels)
+        self.ess_instrument = EssInstrument(
+            "MockSensor", sel_temperature, callback_func=self._callback
+        )
+        self.addAsyncCleanup(self.ess_instrument.stop)
@@ -16,7 +16,6 @@
 # MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
 # GNU General Public License for more details.
 
-import asyncio
 import unittest
 
 from lsst.ts.ess.mock.mock_temperature_sensor import (
@@ -31,8 +30,7 @@ class MockTestCase(unittest.IsolatedAsyncioTestCase):
         num_channels = 4
         ess_sensor = MockTemperatureSensor("MockSensor", num_channels)
         ess_sensor.terminator = "\r\n"
-        loop = asyncio.get_event_loop()
-        err, resp = await loop.run_in_executor(None, ess_sensor.readline)
+        err, resp = await ess_sensor.readline()
         resp = resp.strip(ess_sensor.terminator)
         data = resp.split(",")
         for i in range(0, num_channels):
@@ -45,8 +43,7 @@ class MockTestCase(unittest.IsolatedAsyncioTestCase):
         count_offset = 1
         ess_sensor = MockTemperatureSensor("MockSensor", num_channels, count_offset)
         ess_sensor.terminator = "\r\n"
-        loop = asyncio.get_event_loop()
-        err, resp = await loop.run_in_executor(None, ess_sensor.readline)
+        err, resp = await ess_sensor.readline()
         resp = resp.strip(ess_sensor.terminator)
         data = resp.split(",")
         for i in range(0, num_channels):
@@ -62,8 +59,7 @@ class MockTestCase(unittest.IsolatedAsyncioTestCase):
             "MockSensor", num_channels, count_offset, nan_channel
         )
         ess_sensor.terminator = "\r\n"
-        loop = asyncio.get_event_loop()
-        err, resp = await loop.run_in_executor(None, ess_sensor.readline)
+        err, resp = await ess_sensor.readline()
         resp = resp.strip(ess_sensor.terminator)
         data = resp.split(",")
         for i in range(0, num_channels):
@@ -73,3 +69,18 @@ class MockTestCase(unittest.IsolatedAsyncioTestCase):
                 self.assertTrue(data_item[1] == "9999.9990")
             else:
                 self.assertTrue(MIN_TEMP <= float(data_item[1]) <= MAX_TEMP)
+
+    async def test_read_nan_out_of_range(self):
+        num_channels = 4
+        for nan_channel in (-1, num_channels):
+            ess_sensor = MockTemperatureSensor(
+                "MockSensor", num_channels, nan_channel=nan_channel
+            )
+            ess_sensor.terminator = "\r\n"
+            err, resp = await ess_sensor.readline()
+            resp = resp.strip(ess_sensor.terminator)
+            data = resp.split(",")
+            self.assertEqual(num_channels, len(data))
+            for i in range(0, num_channels):
+                data_item = data[i].split("=")
+                self.assertTrue(MIN_TEMP <= float(data_item[1]) <= MAX_TEMP)
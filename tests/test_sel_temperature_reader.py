@@ -16,9 +16,16 @@
 # MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
 # GNU General Public License for more details.
 
+import asyncio
+import threading
+import time
 import unittest
 
-from lsst.ts.ess.sel_temperature_reader import SelTemperature, DELIMITER
+from lsst.ts.ess.sel_temperature_reader import (
+    SelTemperature,
+    DELIMITER,
+    DEFAULT_VAL,
+)
 from lsst.ts.ess.mock.mock_temperature_sensor import (
     MockTemperatureSensor,
     MIN_TEMP,
@@ -26,11 +33,72 @@ from lsst.ts.ess.mock.mock_temperature_sensor import (
 )
 
 
+class BlockingMockSensor:
+    """Comport with a blocking readline, like VcpFtdi and RpiSerialHat."""
+
+    name = "BlockingMockSensor"
+
+    def __init__(self, line, error=None):
+        self.line = line
+        self.error = error
+        self.num_readline_calls = 0
+        self.in_readline = False
+        self.closed_in_readline = False
+        self.max_concurrent_readlines = 0
+        self._num_concurrent_readlines = 0
+        self._lock = threading.Lock()
+
+    async def open(self):
+        pass
+
+    async def close(self):
+        self.closed_in_readline = self.in_readline
+
+    def readline(self):
+        with self._lock:
+            self.num_readline_calls += 1
+            self._num_concurrent_readlines += 1
+            self.max_concurrent_readlines = max(
+                self.max_concurrent_readlines, self._num_concurrent_readlines
+            )
+        self.in_readline = True
+        try:
+            time.sleep(0.1)
+            if self.error is not None:
+                raise self.error
+            return "OK", self.line
+        finally:
+            self.in_readline = False
+            with self._lock:
+                self._num_concurrent_readlines -= 1
+
+
+class SequenceMockSensor:
+    """Comport with a coroutine readline returning the given lines in order."""
+
+    name = "SequenceMockSensor"
+
+    def __init__(self, lines, close_error=None):
+        self.lines = list(lines)
+        self.close_error = close_error
+
+    async def open(self):
+        pass
+
+    async def close(self):
+        if self.close_error is not None:
+            raise self.close_error
+
+    async def readline(self):
+        return "OK", self.lines.pop(0)
+
+
 class SelTemperatureReaderTestCase(unittest.IsolatedAsyncioTestCase):
     async def test_sel_temperature_reader(self):
         num_channels = 4
         device = MockTemperatureSensor("MockSensor", num_channels)
         sel_temperature = SelTemperature("MockSensor", device, num_channels)
+        self.addAsyncCleanup(sel_temperature.stop)
         await sel_temperature.start()
         await sel_temperature.read()
         data = sel_temperature.output
@@ -38,13 +106,13 @@ class SelTemperatureReaderTestCase(unittest.IsolatedAsyncioTestCase):
         for i in range(0, 4):
             data_item = data[i + 2]
             self.assertTrue(MIN_TEMP <= float(data_item) <= MAX_TEMP)
-        await sel_temperature.stop()
 
     async def test_old_sel_temperature_reader(self):
         num_channels = 4
         count_offset = 1
         device = MockTemperatureSensor("MockSensor", num_channels, count_offset)
         sel_temperature = SelTemperature("MockSensor", device, num_channels)
+        self.addAsyncCleanup(sel_temperature.stop)
         await sel_temperature.start()
         await sel_temperature.read()
         data = sel_temperature.output
@@ -52,7 +120,6 @@ class SelTemperatureReaderTestCase(unittest.IsolatedAsyncioTestCase):
         for i in range(0, 4):
             data_item = data[i + 2]
             self.assertTrue(MIN_TEMP <= float(data_item) <= MAX_TEMP)
-        await sel_temperature.stop()
 
     async def test_nan_sel_temperature_reader(self):
         num_channels = 4
@@ -62,6 +129,7 @@ class SelTemperatureReaderTestCase(unittest.IsolatedAsyncioTestCase):
             "MockSensor", num_channels, count_offset, nan_channel=nan_channel
         )
         sel_temperature = SelTemperature("MockSensor", device, num_channels)
+        self.addAsyncCleanup(sel_temperature.stop)
         await sel_temperature.start()
         await sel_temperature.read()
         data = sel_temperature.output
@@ -72,4 +140,154 @@ class SelTemperatureReaderTestCase(unittest.IsolatedAsyncioTestCase):
                 self.assertAlmostEqual(9999.999, float(data_item), 3)
             else:
                 self.assertTrue(MIN_TEMP <= float(data_item) <= MAX_TEMP)
+
+    async def test_multiple_use(self):
+        num_channels = 4
+        device = MockTemperatureSensor("MockSensor", num_channels)
+        sel_temperature = SelTemperature("MockSensor", device, num_channels)
+        self.addAsyncCleanup(sel_temperature.stop)
+        other_device = MockTemperatureSensor("OtherSensor", num_channels)
+        with self.assertRaises(IndexError):
+            SelTemperature("MockSensor", other_device, num_channels)
+        with self.assertRaises(IndexError):
+            SelTemperature("OtherSensor", device, num_channels)
+        await sel_temperature.start()
+        await sel_temperature.stop()
+
+        # Stopping releases the instance name and the device.
+        sel_temperature = SelTemperature("MockSensor", device, num_channels)
+        self.addAsyncCleanup(sel_temperature.stop)
+        await sel_temperature.start()
         await sel_temperature.stop()
+
+    async def test_blocking_comport(self):
+        num_channels = 4
+        device = BlockingMockSensor(
+            "C01=0020.0000,C02=-201.0000,C03=0025.5000,C04=0030.0000\r\n"
+        )
+        sel_temperature = SelTemperature("MockSensor", device, num_channels)
+        self.addAsyncCleanup(sel_temperature.stop)
+        await sel_temperature.start()
+        await sel_temperature.read()
+        await sel_temperature.read()
+        data = sel_temperature.output
+        self.assertEqual("OK", data[1])
+        self.assertEqual(20.0, data[2])
+        self.assertAlmostEqual(9999.999, float(data[3]), 3)
+        self.assertEqual(25.5, data[4])
+        self.assertEqual(30.0, data[5])
+
+    async def test_blocking_comport_error(self):
+        num_channels = 4
+        device = BlockingMockSensor(None, error=OSError("Serial port failure."))
+        sel_temperature = SelTemperature("MockSensor", device, num_channels)
+        self.addAsyncCleanup(sel_temperature.stop)
+        await sel_temperature.start()
+        with self.assertRaises(OSError):
+            await sel_temperature.read()
+        # Reading stops after the error, which is raised again by later reads.
+        await asyncio.sleep(0.3)
+        self.assertEqual(1, device.num_readline_calls)
+        with self.assertRaises(OSError):
+            await sel_temperature.read()
+        await sel_temperature.stop()
+
+    async def test_blocking_comport_stop_in_readline(self):
+        num_channels = 4
+        device = BlockingMockSensor(
+            "C01=0020.0000,C02=-201.0000,C03=0025.5000,C04=0030.0000\r\n"
+        )
+        sel_temperature = SelTemperature("MockSensor", device, num_channels)
+        self.addAsyncCleanup(sel_temperature.stop)
+        await sel_temperature.start()
+        await asyncio.sleep(0.05)
+        self.assertTrue(device.in_readline)
+        # Stop waits for the current readline before closing the comport.
+        await sel_temperature.stop()
+        self.assertFalse(device.closed_in_readline)
+        self.assertEqual(1, device.num_readline_calls)
+
+    async def test_malformed_lines(self):
+        num_channels = 4
+        good_line = "C01=0020.0000,C02=0021.0000,C03=0025.5000,C04=0030.0000\r\n"
+        channel_error = "Malformed response. Channel preamble or channel data incorrect"
+        line_error = "Malformed response. Terminator or line size incorrect"
+        malformed_lines = [
+            # Channel numbering starts at neither 00 nor 01.
+            (
+                "C02=0020.0000,C03=0021.0000,C04=0025.5000,C05=0030.0000\r\n",
+                channel_error,
+            ),
+            # Channel numbering is not consecutive.
+            (
+                "C01=0020.0000,C02=0021.0000,C04=0025.5000,C05=0030.0000\r\n",
+                channel_error,
+            ),
+            # Incorrect delimiter.
+            (
+                "C01=0020.0000;C02=0021.0000,C03=0025.5000,C04=0030.0000\r\n",
+                channel_error,
+            ),
+            # Non-digit character in a value.
+            (
+                "C01=0020.0000,C02=00x1.0000,C03=0025.5000,C04=0030.0000\r\n",
+                channel_error,
+            ),
+            # Decimal point in the wrong position.
+            (
+                "C01=0020.0000,C02=00210.000,C03=0025.5000,C04=0030.0000\r\n",
+                channel_error,
+            ),
+            # Short line.
+            ("C01=0020.0000,C02=0021.0000,C03=0025.5000,C04=0030.000\r\n", line_error),
+            # Missing terminator.
+            ("C01=0020.0000,C02=0021.0000,C03=0025.5000,C04=0030.0000\n\n", line_error),
+        ]
+        for line, error in malformed_lines:
+            with self.subTest(line=line):
+                device = SequenceMockSensor([good_line, line])
+                sel_temperature = SelTemperature("MockSensor", device, num_channels)
+                await sel_temperature.start()
+                try:
+                    await sel_temperature.read()
+                    data = sel_temperature.output
+                    self.assertEqual("OK", data[1])
+                    self.assertEqual([20.0, 21.0, 25.5, 30.0], data[2:])
+
+                    await sel_temperature.read()
+                    data = sel_temperature.output
+                    self.assertEqual(f"{error}: {line}", data[1])
+                    self.assertEqual([DEFAULT_VAL] * num_channels, data[2:])
+                finally:
+                    await sel_temperature.stop()
+
+    async def test_stop_with_close_error(self):
+        num_channels = 4
+        device = SequenceMockSensor([], close_error=IOError("Failed to close."))
+        sel_temperature = SelTemperature("MockSensor", device, num_channels)
+        self.addAsyncCleanup(sel_temperature.stop)
+        await sel_temperature.start()
+        with self.assertRaises(IOError):
+            await sel_temperature.stop()
+
+        # The instance name and device are released despite the error.
+        device.close_error = None
+        sel_temperature = SelTemperature("MockSensor", device, num_channels)
+        self.addAsyncCleanup(sel_temperature.stop)
+        await sel_temperature.start()
+        await sel_temperature.stop()
+
+    async def test_blocking_comport_start_twice(self):
+        num_channels = 4
+        device = BlockingMockSensor(
+            "C01=0020.0000,C02=-201.0000,C03=0025.5000,C04=0030.0000\r\n"
+        )
+        sel_temperature = SelTemperature("MockSensor", device, num_channels)
+        self.addAsyncCleanup(sel_temperature.stop)
+        await sel_temperature.start()
+        # Starting again must not start a second thread reading the comport.
+        await sel_temperature.start()
+        await sel_temperature.read()
+        await asyncio.sleep(0.3)
+        self.assertEqual(1, device.max_concurrent_readlines)
+        self.assertEqual("OK", sel_temperature.output[1])